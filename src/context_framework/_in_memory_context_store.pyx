@@ -0,0 +1,68 @@
+# cython: language_level=3
+"""
+_in_memory_context_store.pyx
+
+An optional Cython-compiled variant of InMemoryContextStore for hot paths.
+Methods are cpdef, so calls from other Cython code resolve at the C level and
+even Python-level calls skip most of the interpreter's frame overhead; the
+dict operations lower to direct PyDict_* calls.
+
+This module is not built automatically. Install Cython (the "speedups" extra)
+and compile in place with:
+
+    cythonize -i src/context_framework/_in_memory_context_store.pyx
+
+When the compiled module is importable, in_memory_context_store exposes it as
+FastInMemoryContextStore; otherwise that name falls back to the pure-Python
+class. The compiled store implements the plain ContextStore protocol (plus
+bulk_set/iter_keys) but intentionally omits the tuple-interning layer: it is
+aimed at tight loops where the caller already reuses key objects.
+"""
+
+from context_framework.exceptions import ContextStoreError
+
+cdef class CInMemoryContextStore:
+    """
+    A Cython-compiled in-memory ContextStore backed by a plain dict.
+    """
+
+    cdef dict _store
+
+    def __cinit__(self):
+        self._store = {}
+
+    cpdef set(self, object key, object value):
+        """Store 'value' under 'key', overwriting any existing entry."""
+        try:
+            self._store[key] = value
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to set key {key}: {ex}")
+
+    cpdef get(self, object key):
+        """Return the metadata stored under 'key', or None if not found."""
+        try:
+            return self._store.get(key)
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to get key {key}: {ex}")
+
+    cpdef delete(self, object key):
+        """Remove the metadata stored under 'key'; a no-op if absent."""
+        try:
+            self._store.pop(key, None)
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to delete key {key}: {ex}")
+
+    cpdef list_keys(self):
+        """Return a list of all stored keys."""
+        return list(self._store)
+
+    def iter_keys(self):
+        """Return a live view of the stored keys without copying."""
+        return self._store.keys()
+
+    def bulk_set(self, items):
+        """Store many (key, value) pairs with a single dict merge."""
+        try:
+            self._store.update(dict(items))
+        except Exception as ex:
+            raise ContextStoreError(f"Failed to bulk-set items: {ex}")
@@ -8,25 +8,47 @@ validations or key transformations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
 from context_framework.context_store import ContextStore
 from context_framework.in_memory_context_store import InMemoryContextStore
-from context_framework.exceptions import ContextStoreError, ContextKeyError
 from context_framework.context_aware_data_structure import ContextAwareDataStructure
 
 class BaseContextAdapter(ABC, ContextAwareDataStructure):
     """
     An optional base adapter that delegates storage to a ContextStore.
     Subclasses can customize key validation or domain logic.
+
+    Adapters are slotted: attribute access goes through slot descriptors
+    rather than an instance __dict__, which is both faster and smaller.
+    Subclasses that add attributes in __init__ must declare them in their
+    own __slots__.
     """
 
-    def __init__(self, context_store: Optional[ContextStore] = None) -> None:
+    __slots__ = ("context_store", "validate_on_read", "_read_cache", "_cache_size")
+
+    def __init__(
+        self,
+        context_store: Optional[ContextStore] = None,
+        validate_on_read: bool = False,
+    ) -> None:
         """
         :param context_store:
             The storage backend that implements set/get/delete/list_keys.
             Defaults to InMemoryContextStore if none is provided.
+        :param validate_on_read:
+            If True, get_context validates keys before reading, raising
+            ContextKeyError for out-of-domain keys. Defaults to False: reads
+            of unknown keys simply return None, and the (potentially
+            expensive) domain check is only paid on writes. Enable this when
+            you want reads to distinguish "no metadata" from "invalid key".
         """
         self.context_store = context_store or InMemoryContextStore()
+        self.validate_on_read = validate_on_read
+        # Small LRU cache for reads requested with get_context(..., cache=True).
+        # Entries for a key are evicted whenever that key is written or removed.
+        self._read_cache: "OrderedDict[Any, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._cache_size = 128
 
     @abstractmethod
     def validate_key(self, key: Any) -> None:
@@ -36,41 +58,150 @@ class BaseContextAdapter(ABC, ContextAwareDataStructure):
         """
         pass
 
+    def _to_store_key(self, key: Any) -> Any:
+        """
+        Translate a domain key into the key actually used in the context
+        store. The default is the identity; subclasses can override to
+        substitute a cheaper representation (e.g., packed integers). Must be
+        deterministic so reads and writes agree.
+        """
+        return key
+
+    def _apply_write(
+        self, key: Any, metadata: Optional[Dict[str, Any]], delete: bool = False
+    ) -> None:
+        """
+        The fused write path: key validation, the store operation, and
+        read-cache eviction in one frame. Both add_context and remove_context
+        funnel through here, so subclasses that want to specialize writes
+        (e.g., inlining their validator) only override this method.
+        """
+        self.validate_key(key)
+        if delete:
+            self.context_store.delete(self._to_store_key(key))
+        else:
+            self.context_store.set(self._to_store_key(key), metadata)
+        if self._read_cache:
+            self._read_cache.pop(key, None)
+
     def add_context(self, key: Any, metadata: Dict[str, Any]) -> None:
         """
         Store metadata for 'key', after validating the key.
         """
-        self.validate_key(key)
-        try:
-            self.context_store.set(key, metadata)
-        except ContextStoreError as ex:
-            raise ex  # re-raise the store error
+        self._apply_write(key, metadata)
 
-    def get_context(self, key: Any) -> Optional[Dict[str, Any]]:
+    def _store_many(self, items: Dict[Any, Dict[str, Any]]) -> None:
         """
-        Retrieve metadata associated with 'key', after validating the key.
+        Persist a batch of already-validated key/metadata pairs, using the
+        store's bulk_set when the backend provides one, and evict the written
+        keys from the read cache.
         """
-        self.validate_key(key)
-        try:
-            return self.context_store.get(key)
-        except ContextStoreError as ex:
-            raise ex
+        if self._read_cache:
+            for key in items:
+                self._read_cache.pop(key, None)
+        items = {self._to_store_key(key): metadata for key, metadata in items.items()}
+        bulk_set = getattr(self.context_store, "bulk_set", None)
+        if bulk_set is not None:
+            bulk_set(items)
+        else:
+            store_set = self.context_store.set
+            for key, metadata in items.items():
+                store_set(key, metadata)
+
+    def add_context_many(self, items: Dict[Any, Dict[str, Any]]) -> None:
+        """
+        Store metadata for many keys in one call. All keys are validated
+        before anything is written, so a single invalid key fails the whole
+        batch without partial writes. Backends exposing bulk_set (e.g.,
+        InMemoryContextStore) receive the batch as one operation.
+
+        :param items: A mapping of key -> metadata dictionary.
+        """
+        for key in items:
+            self.validate_key(key)
+        self._store_many(items)
+
+    def get_context_many(self, keys: Iterable[Any]) -> Dict[Any, Optional[Dict[str, Any]]]:
+        """
+        Retrieve metadata for many keys in one call. Follows the same
+        validate_on_read semantics as get_context: by default unknown keys
+        simply map to None.
+
+        :param keys: An iterable of keys to look up.
+        :return: A dict mapping each requested key to its metadata (or None).
+        """
+        if self.validate_on_read:
+            keys = list(keys)
+            for key in keys:
+                self.validate_key(key)
+        store_get = self.context_store.get
+        to_store_key = self._to_store_key
+        return {key: store_get(to_store_key(key)) for key in keys}
+
+    def get_context(self, key: Any, *, cache: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve metadata associated with 'key'. The key is only validated
+        when the adapter was constructed with validate_on_read=True; otherwise
+        unknown or out-of-domain keys just return None.
+
+        :param cache:
+            If True, serve the read through a small per-adapter LRU cache
+            (most recent 128 keys), skipping both validation and the store
+            lookup on a hit. Useful for pipelines that fetch the same
+            annotation many times. Writes and removals through this adapter
+            evict the affected key; reads that bypass the adapter (e.g.,
+            sharing one store between adapters) can leave stale entries.
+        """
+        if cache:
+            # TypeError (unhashable key) falls through to the store path,
+            # which wraps it as ContextStoreError like an uncached read.
+            try:
+                value = self._read_cache[key]
+            except (KeyError, TypeError):
+                pass
+            else:
+                self._read_cache.move_to_end(key)
+                return value
+        if self.validate_on_read:
+            self.validate_key(key)
+        value = self.context_store.get(self._to_store_key(key))
+        if cache:
+            try:
+                self._read_cache[key] = value
+            except TypeError:
+                return value
+            if len(self._read_cache) > self._cache_size:
+                self._read_cache.popitem(last=False)
+        return value
+
+    def get_context_unchecked(self, key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve metadata associated with 'key' without any key validation,
+        regardless of the validate_on_read setting. A fast path for callers
+        that already know the key is in-domain (e.g., keys obtained from
+        list_context_keys or produced by a prior add_context).
+        """
+        return self.context_store.get(self._to_store_key(key))
 
     def remove_context(self, key: Any) -> None:
         """
         Remove metadata associated with 'key'.
         """
-        self.validate_key(key)
-        try:
-            self.context_store.delete(key)
-        except ContextStoreError as ex:
-            raise ex
+        self._apply_write(key, None, delete=True)
 
-    def list_context_keys(self) -> List[Any]:
+    def list_context_keys(self, as_iter: bool = False) -> Iterable[Any]:
         """
-        Return all known keys from the underlying context store.
+        Return all known keys from the underlying context store. Any
+        ContextStoreError from the backend propagates to the caller.
+
+        :param as_iter:
+            If True and the backend exposes an iter_keys view (e.g.,
+            InMemoryContextStore), return that view instead of copying the
+            keys into a list — worthwhile when iterating over very large
+            stores. Defaults to False, returning a list as before.
         """
-        try:
-            return self.context_store.list_keys()
-        except ContextStoreError as ex:
-            raise ex
+        if as_iter:
+            iter_keys = getattr(self.context_store, "iter_keys", None)
+            if iter_keys is not None:
+                return iter_keys()
+        return self.context_store.list_keys()
@@ -5,10 +5,45 @@ An example adapter for Pandas DataFrame objects. This adapter interprets
 keys as something like ("column", column_name) or ("row", row_index, "column", col_name).
 """
 
+import operator
+import sys
+from weakref import WeakValueDictionary
+
 import pandas as pd
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, Optional
 from context_framework.adapters.base_adapter import BaseContextAdapter
 from context_framework.exceptions import ContextKeyError
+from context_framework.keys import ColKey, RowColKey
+
+# Numba is an optional accelerator (install with the "jit" extra). When it is
+# available and the DataFrame schema is type-homogeneous, key validation is
+# routed through JIT-compiled lookups against numba.typed.Dict tables.
+try:
+    from numba import njit, types as _nb_types
+    from numba.typed import Dict as _NumbaDict
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Packed-key layout (pack_keys=True): a 2-bit kind tag above a 46-bit row
+# label and a 16-bit column id, so every supported key shape fits one int.
+# Dict operations on small ints are cheaper than hashing a fresh tuple.
+_PACK_KIND_COL = 1 << 62
+_PACK_KIND_ROW_COL = 2 << 62
+_PACK_KIND_ROW = 3 << 62
+_PACK_ROW_LIMIT = 1 << 46
+_PACK_COL_LIMIT = 1 << 16
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _nb_contains_str(name, table) -> bool:
+        return name in table
+
+    @njit(cache=True)
+    def _nb_contains_int(idx, table) -> bool:
+        return idx in table
 
 class PandasContextAdapter(BaseContextAdapter):
     """
@@ -16,15 +51,331 @@ class PandasContextAdapter(BaseContextAdapter):
     keys as either ("column", col_name) or ("row", row_index, "column", col_name).
     """
 
-    def __init__(self, df: pd.DataFrame, context_store=None) -> None:
+    __slots__ = (
+        "df",
+        "_col_cache",
+        "_idx_cache",
+        "_validators",
+        "_nb_cols",
+        "_nb_idx",
+        "_col_id",
+        "_key_pool",
+        "_interned_cols",
+    )
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        context_store=None,
+        validate_on_read: bool = False,
+        pack_keys: bool = False,
+    ) -> None:
         """
         :param df:
             The Pandas DataFrame to wrap.
         :param context_store:
             An optional ContextStore for metadata persistence.
+        :param validate_on_read:
+            If True, get_context validates keys against the DataFrame before
+            reading; see BaseContextAdapter.
+        :param pack_keys:
+            If True, keys are stored as packed integers (column id plus row
+            label in one int) rather than tuples, making store lookups a
+            single int hash. Requires fewer than 65536 columns; keys with
+            non-integer or very large row labels fall back to their tuple
+            form. Note that list_context_keys then returns the packed
+            representation, so only enable this when the store is private to
+            this adapter.
         """
-        super().__init__(context_store)
+        super().__init__(context_store, validate_on_read=validate_on_read)
         self.df = df
+        # Lazily-built membership caches over df.columns / df.index. Checking
+        # containment against a plain frozenset avoids the per-call overhead of
+        # pd.Index.__contains__, which dominates validate_key on wide frames.
+        self._col_cache: Optional[FrozenSet[Any]] = None
+        self._idx_cache: Optional[FrozenSet[Any]] = None
+        # Map each string column name to its sys.intern'd instance. Interned
+        # strings let dict/set probes short-circuit on identity ('is') before
+        # falling back to character-by-character comparison, which matters
+        # when the same column is referenced millions of times.
+        self._interned_cols: Dict[Any, str] = {
+            c: sys.intern(c) for c in df.columns if isinstance(c, str)
+        }
+        # Dispatch table mapping (key[0], len(key)) to a validator, so that
+        # validate_key is a single dict lookup instead of an if/elif ladder.
+        self._validators: Dict[Any, Callable[[tuple], None]] = {
+            ("column", 2): self._v_col,
+            ("row", 2): self._v_row,
+            ("row", 4): self._v_row_col,
+        }
+        # JIT-compiled lookup tables; stay None unless Numba is installed and
+        # the schema is homogeneous enough to type-specialize.
+        self._nb_cols = None
+        self._nb_idx = None
+        if _HAS_NUMBA:
+            self._init_jit_tables()
+        # Column-name -> small-int id table; None when key packing is off
+        # (or impossible because the frame is too wide for 16-bit ids).
+        self._col_id: Optional[Dict[Any, int]] = None
+        if pack_keys and len(df.columns) < _PACK_COL_LIMIT:
+            self._col_id = {name: i for i, name in enumerate(df.columns)}
+        # Pool of interned ColKey/RowColKey instances handed out by
+        # canonical_key, so a hot key's hash is computed exactly once. Values
+        # are held weakly: an entry lives only as long as some caller (or the
+        # store) keeps the key object, so one-off keys cannot accumulate.
+        self._key_pool: "WeakValueDictionary[tuple, Any]" = WeakValueDictionary()
+
+    def canonical_key(self, key: Any) -> Any:
+        """
+        Return a shared hash-caching key object (ColKey/RowColKey) for a
+        supported tuple key, creating and interning it on first request.
+        Repeated calls with a structurally-equal tuple return the same
+        instance, whose precomputed hash makes it the cheapest possible dict
+        key for repeated lookups. The returned object compares equal to its
+        tuple form, so both can be used interchangeably with this adapter.
+        Unsupported key shapes are returned unchanged.
+        """
+        if isinstance(key, tuple):
+            cached = self._key_pool.get(key)
+            if cached is not None:
+                return cached
+            interned = self._interned_cols
+            n = len(key)
+            if n == 2 and key[0] == "column":
+                cached = ColKey(interned.get(key[1], key[1]))
+            elif n == 4 and key[0] == "row" and key[2] == "column":
+                cached = RowColKey(key[1], interned.get(key[3], key[3]))
+            else:
+                return key
+            self._key_pool[key] = cached
+            return cached
+        return key
+
+    def _to_store_key(self, key: Any) -> Any:
+        """
+        Pack a validated tuple key into a single int when pack_keys is
+        enabled. Keys that don't fit the packed layout pass through unchanged.
+        """
+        col_id = self._col_id
+        if col_id is None:
+            return key
+        if isinstance(key, (ColKey, RowColKey)):
+            key = key.as_tuple()
+        if not isinstance(key, tuple):
+            return key
+        n = len(key)
+        if n == 2:
+            if key[0] == "column":
+                cid = col_id.get(key[1])
+                if cid is not None:
+                    return _PACK_KIND_COL | cid
+            elif key[0] == "row":
+                try:
+                    row = operator.index(key[1])
+                except TypeError:
+                    return key
+                if 0 <= row < _PACK_ROW_LIMIT:
+                    return _PACK_KIND_ROW | (row << 16)
+        elif n == 4 and key[0] == "row" and key[2] == "column":
+            cid = col_id.get(key[3])
+            if cid is not None:
+                try:
+                    row = operator.index(key[1])
+                except TypeError:
+                    return key
+                if 0 <= row < _PACK_ROW_LIMIT:
+                    return _PACK_KIND_ROW_COL | (row << 16) | cid
+        return key
+
+    def _init_jit_tables(self) -> None:
+        """
+        Build numba.typed.Dict lookup tables for the DataFrame's columns and
+        index when their types are homogeneous (all-str columns, int64 index),
+        and swap in JIT-backed validators. Silently falls back to the
+        pure-Python path if the schema is heterogeneous or compilation fails.
+        """
+        try:
+            if all(isinstance(c, str) for c in self.df.columns):
+                cols = _NumbaDict.empty(_nb_types.unicode_type, _nb_types.int64)
+                for i, name in enumerate(self.df.columns):
+                    cols[name] = i
+                self._nb_cols = cols
+                self._validators[("column", 2)] = self._v_col_jit
+            if self.df.index.dtype.kind == "i":
+                idx = _NumbaDict.empty(_nb_types.int64, _nb_types.int64)
+                for i, label in enumerate(self.df.index):
+                    idx[label] = i
+                self._nb_idx = idx
+                self._validators[("row", 2)] = self._v_row_jit
+            if self._nb_cols is not None and self._nb_idx is not None:
+                self._validators[("row", 4)] = self._v_row_col_jit
+        except Exception:
+            # Optional acceleration only; never fail adapter construction.
+            self._nb_cols = None
+            self._nb_idx = None
+
+    def _v_col_jit(self, key: tuple) -> None:
+        """JIT fast path for ("column", col_name); falls back on type mismatch."""
+        if isinstance(key[1], str) and _nb_contains_str(key[1], self._nb_cols):
+            return
+        self._v_col(key)
+
+    def _v_row_jit(self, key: tuple) -> None:
+        """JIT fast path for ("row", row_index); falls back on type mismatch."""
+        if isinstance(key[1], int):
+            # Numba raises OverflowError for ints that don't fit int64;
+            # treat that like any other type mismatch and fall through.
+            try:
+                if _nb_contains_int(key[1], self._nb_idx):
+                    return
+            except (TypeError, OverflowError):
+                pass
+        self._v_row(key)
+
+    def _v_row_col_jit(self, key: tuple) -> None:
+        """JIT fast path for ("row", row_index, "column", col_name)."""
+        if isinstance(key[1], int) and isinstance(key[3], str) and key[2] == "column":
+            try:
+                if _nb_contains_int(key[1], self._nb_idx) and _nb_contains_str(
+                    key[3], self._nb_cols
+                ):
+                    return
+            except (TypeError, OverflowError):
+                pass
+        self._v_row_col(key)
+
+    def _cols(self) -> FrozenSet[Any]:
+        """
+        Return a cached frozenset of the DataFrame's column labels,
+        building it on first use.
+        """
+        if self._col_cache is None:
+            interned = self._interned_cols
+            self._col_cache = frozenset(interned.get(c, c) for c in self.df.columns)
+        return self._col_cache
+
+    def _idx(self) -> FrozenSet[Any]:
+        """
+        Return a cached frozenset of the DataFrame's index labels,
+        building it on first use.
+        """
+        if self._idx_cache is None:
+            self._idx_cache = frozenset(self.df.index)
+        return self._idx_cache
+
+    def invalidate_caches(self) -> None:
+        """
+        Discard the cached column/index lookups. Call this after mutating the
+        wrapped DataFrame's columns or index (e.g., adding a column, reindexing)
+        so that subsequent key validation sees the new schema.
+        """
+        self._col_cache = None
+        self._idx_cache = None
+        if self._nb_cols is not None or self._nb_idx is not None:
+            # The JIT validators consult their typed-Dict tables before the
+            # rebuilt frozensets, so stale tables would keep accepting removed
+            # labels. Reset to the pure-Python validators and rebuild the
+            # tables against the current schema.
+            self._validators[("column", 2)] = self._v_col
+            self._validators[("row", 2)] = self._v_row
+            self._validators[("row", 4)] = self._v_row_col
+            self._nb_cols = None
+            self._nb_idx = None
+            if _HAS_NUMBA:
+                self._init_jit_tables()
+        for name in self.df.columns:
+            if isinstance(name, str) and name not in self._interned_cols:
+                self._interned_cols[name] = sys.intern(name)
+        if self._col_id is not None:
+            # Extend the packing table with any new columns; existing ids are
+            # kept stable so previously stored packed keys remain reachable.
+            for name in self.df.columns:
+                if name not in self._col_id and len(self._col_id) < _PACK_COL_LIMIT:
+                    self._col_id[name] = len(self._col_id)
+
+    def _v_col(self, key: tuple) -> None:
+        """Validate a ("column", col_name) key."""
+        _, col = key
+        if col in self._cols():
+            return
+        raise ContextKeyError(f"Column '{col}' not found in DataFrame.")
+
+    def _v_row(self, key: tuple) -> None:
+        """Validate a ("row", row_index) key."""
+        _, idx = key
+        if idx in self._idx():
+            return
+        raise ContextKeyError(f"Row index '{idx}' not found in DataFrame.")
+
+    def _v_row_col(self, key: tuple) -> None:
+        """Validate a ("row", row_index, "column", col_name) key."""
+        _, idx, marker, col = key
+        if marker == "column":
+            if idx in self._idx() and col in self._cols():
+                return
+            if idx not in self._idx():
+                raise ContextKeyError(f"Row index '{idx}' not found in DataFrame.")
+            raise ContextKeyError(f"Column '{col}' not found in DataFrame.")
+        raise ContextKeyError(f"Invalid key pattern for row-level context: {key}")
+
+    def _apply_write(
+        self, key: Any, metadata: Optional[Dict[str, Any]], delete: bool = False
+    ) -> None:
+        """
+        Fused write path with the validate_key dispatch inlined, so
+        add_context/remove_context skip one Python call frame per write.
+        validate_key itself is unchanged for external callers.
+        """
+        raw = key.as_tuple() if isinstance(key, (ColKey, RowColKey)) else key
+        if isinstance(raw, tuple) and raw:
+            validator = self._validators.get((raw[0], len(raw)))
+            if validator is not None:
+                validator(raw)
+                if delete:
+                    self.context_store.delete(self._to_store_key(key))
+                else:
+                    self.context_store.set(self._to_store_key(key), metadata)
+                if self._read_cache:
+                    self._read_cache.pop(key, None)
+                return
+        raise ContextKeyError(f"Key '{key}' is not a valid Pandas context reference.")
+
+    def add_context_many(self, items: Dict[Any, Dict[str, Any]]) -> None:
+        """
+        Store metadata for many keys in one call, validating the batch with
+        two vectorized Index.isin checks (one over column names, one over row
+        labels) instead of one validate_key round-trip per key. Keys that
+        don't match a known shape fail the batch before anything is written.
+
+        :param items: A mapping of key -> metadata dictionary.
+        """
+        col_names = []
+        row_labels = []
+        for key in items:
+            if isinstance(key, tuple):
+                n = len(key)
+                if n == 2 and key[0] == "column":
+                    col_names.append(key[1])
+                    continue
+                if n == 2 and key[0] == "row":
+                    row_labels.append(key[1])
+                    continue
+                if n == 4 and key[0] == "row" and key[2] == "column":
+                    row_labels.append(key[1])
+                    col_names.append(key[3])
+                    continue
+            raise ContextKeyError(f"Key '{key}' is not a valid Pandas context reference.")
+        if col_names:
+            known = pd.Index(col_names).isin(self.df.columns)
+            if not known.all():
+                missing = col_names[int(known.argmin())]
+                raise ContextKeyError(f"Column '{missing}' not found in DataFrame.")
+        if row_labels:
+            known = pd.Index(row_labels).isin(self.df.index)
+            if not known.all():
+                missing = row_labels[int(known.argmin())]
+                raise ContextKeyError(f"Row index '{missing}' not found in DataFrame.")
+        self._store_many(items)
 
     def validate_key(self, key: Any) -> None:
         """
@@ -34,35 +385,15 @@ class PandasContextAdapter(BaseContextAdapter):
         Typical key patterns:
           ("column", "GeneSymbol")
           ("row", 42, "column", "Expression")
+
+        Interned key objects from canonical_key are validated via their
+        tuple form.
         """
-        if isinstance(key, tuple) and len(key) >= 2:
-            key_type = key[0]
-            if key_type == "column":
-                # Example: ("column", "GeneSymbol")
-                col_name = key[1]
-                if col_name not in self.df.columns:
-                    raise ContextKeyError(f"Column '{col_name}' not found in DataFrame.")
-            elif key_type == "row":
-                # Example: ("row", 10, "column", "GeneSymbol")
-                if len(key) < 4:
-                    # We might just accept ("row", index), or require ("row", index, "column", col_name)
-                    # Depending on your domain. Let's do a simple check.
-                    row_index = key[1]
-                    if row_index not in self.df.index:
-                        raise ContextKeyError(f"Row index '{row_index}' not found in DataFrame.")
-                else:
-                    row_index = key[1]
-                    if row_index not in self.df.index:
-                        raise ContextKeyError(f"Row index '{row_index}' not found in DataFrame.")
-                    if key[2] == "column":
-                        col_name = key[3]
-                        if col_name not in self.df.columns:
-                            raise ContextKeyError(f"Column '{col_name}' not found in DataFrame.")
-                    else:
-                        raise ContextKeyError(f"Invalid key pattern for row-level context: {key}")
-            else:
-                # If the first element is not recognized, raise an error
-                raise ContextKeyError(f"Unrecognized key pattern: {key}")
-        else:
-            # If it's not a tuple or doesn't have enough elements, let's raise an error
-            raise ContextKeyError(f"Key '{key}' is not a valid Pandas context reference.")
+        if isinstance(key, (ColKey, RowColKey)):
+            key = key.as_tuple()
+        if isinstance(key, tuple) and key:
+            validator = self._validators.get((key[0], len(key)))
+            if validator is not None:
+                validator(key)
+                return
+        raise ContextKeyError(f"Key '{key}' is not a valid Pandas context reference.")
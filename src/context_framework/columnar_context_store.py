@@ -0,0 +1,147 @@
+"""
+columnar_context_store.py
+
+Provides a columnar (struct-of-arrays) in-memory implementation of the
+ContextStore interface. Instead of one small metadata dict per key, values are
+stored field-by-field in shared column lists indexed by an integer key-id.
+This is an opt-in alternative to InMemoryContextStore for workloads that store
+very many entries sharing a repeated schema (e.g., {"source": ..., "confidence": ...}
+for every column of a large DataFrame): it avoids the per-entry dict overhead
+and makes field-oriented scans a linear sweep over one contiguous list.
+"""
+
+from typing import Any, Dict, KeysView, List, Optional
+from .context_store import ContextStore
+from .exceptions import ContextStoreError
+
+# Sentinel marking "no value for this field" so that None remains storable.
+_MISSING = object()
+
+class ColumnarContextStore:
+    """
+    A struct-of-arrays implementation of the ContextStore. Each metadata field
+    becomes a column list; each key is assigned an integer id used to index
+    into every column. Best suited to large numbers of entries with a small,
+    repeating set of metadata fields.
+    """
+
+    __slots__ = ("_key_to_id", "_id_to_key", "_columns")
+
+    def __init__(self) -> None:
+        """
+        Initialize the columnar store with no keys and no columns.
+        """
+        self._key_to_id: Dict[Any, int] = {}
+        self._id_to_key: List[Any] = []
+        self._columns: Dict[str, List[Any]] = {}
+
+    def _column(self, field: str) -> List[Any]:
+        """
+        Return the column list for 'field', creating it (padded with the
+        missing-value sentinel for all existing ids) on first use.
+        """
+        column = self._columns.get(field)
+        if column is None:
+            column = [_MISSING] * len(self._id_to_key)
+            self._columns[field] = column
+        return column
+
+    def set(self, key: Any, value: Dict[str, Any]) -> None:
+        """
+        Store 'value' under 'key'. Overwrites any existing entry for 'key'.
+
+        :param key: The hashable identifier to store context data for.
+        :param value: The dictionary of metadata to store.
+        :raises ContextStoreError: If 'key' is not hashable.
+        """
+        try:
+            entry_id = self._key_to_id.get(key)
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to set key {key}: {ex}")
+        if entry_id is None:
+            entry_id = len(self._id_to_key)
+            self._key_to_id[key] = entry_id
+            self._id_to_key.append(key)
+            for column in self._columns.values():
+                column.append(_MISSING)
+        else:
+            # Overwrite: clear the old row so stale fields don't survive.
+            for column in self._columns.values():
+                column[entry_id] = _MISSING
+        for field, field_value in value.items():
+            self._column(field)[entry_id] = field_value
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the metadata for 'key' if it exists, reassembling the
+        dictionary from the column lists.
+
+        :param key: The identifier whose metadata we want.
+        :return: The context metadata dictionary, or None if not found.
+        :raises ContextStoreError: If 'key' is not hashable.
+        """
+        try:
+            entry_id = self._key_to_id.get(key)
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to get key {key}: {ex}")
+        if entry_id is None:
+            return None
+        return {
+            field: column[entry_id]
+            for field, column in self._columns.items()
+            if column[entry_id] is not _MISSING
+        }
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove the metadata associated with 'key'. The entry's id is retired
+        rather than reused; its column slots are cleared to the sentinel.
+
+        :param key: The identifier referencing the stored metadata to remove.
+        :raises ContextStoreError: If 'key' is not hashable.
+        """
+        try:
+            entry_id = self._key_to_id.pop(key, None)
+        except TypeError as ex:
+            raise ContextStoreError(f"Failed to delete key {key}: {ex}")
+        if entry_id is not None:
+            self._id_to_key[entry_id] = _MISSING
+            for column in self._columns.values():
+                column[entry_id] = _MISSING
+
+    def list_keys(self) -> List[Any]:
+        """
+        List all keys currently stored.
+
+        :return: A list of keys that have associated metadata.
+        """
+        return list(self._key_to_id)
+
+    def iter_keys(self) -> KeysView[Any]:
+        """
+        Return a live view of the stored keys without copying them into a
+        list; see InMemoryContextStore.iter_keys for the caveats.
+
+        :return: A dictionary keys view over the stored keys.
+        """
+        return self._key_to_id.keys()
+
+    def find_keys(self, field: str, value: Any) -> List[Any]:
+        """
+        Return all keys whose metadata has 'field' equal to 'value'. This is
+        the scan the columnar layout is built for: one linear sweep over a
+        single column list instead of a dict lookup per stored entry.
+
+        :param field: The metadata field to match on.
+        :param value: The field value to look for.
+        :return: A list of matching keys (empty if the field is unknown).
+        """
+        column = self._columns.get(field)
+        if column is None:
+            return []
+        id_to_key = self._id_to_key
+        return [
+            id_to_key[i]
+            for i, stored in enumerate(column)
+            if stored is not _MISSING and stored == value
+        ]
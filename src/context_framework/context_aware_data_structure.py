@@ -13,6 +13,10 @@ class ContextAwareDataStructure(Protocol):
     context (metadata). All adapters must conform to these method signatures.
     """
 
+    # Empty slots so that implementations inheriting from this Protocol can
+    # themselves use __slots__ without picking up an instance __dict__.
+    __slots__ = ()
+
     def add_context(self, key: Any, metadata: Dict[str, Any]) -> None:
         """
         Add metadata for a specific key in the data structure.
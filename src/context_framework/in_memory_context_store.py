@@ -7,7 +7,7 @@ for multi-process concurrency or production environments with high availability
 requirements.
 """
 
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Iterable, KeysView, Optional, List, Tuple
 from .context_store import ContextStore
 from .exceptions import ContextStoreError
 
@@ -17,11 +17,48 @@ class InMemoryContextStore:
     pairs in a local Python dict.
     """
 
-    def __init__(self) -> None:
+    __slots__ = ("_store", "_intern")
+
+    def __init__(self, initial_capacity: int = 0) -> None:
         """
         Initialize the in-memory store with an empty dictionary.
+
+        :param initial_capacity:
+            Optional hint for the number of entries the store is expected to
+            hold. When positive, the underlying dict is grown up-front so that
+            bulk loads avoid repeated incremental rehashes. Purely a
+            best-effort performance hint; it does not limit the store's size.
+        """
+        # The backing dict is created lazily on first write: adapters are often
+        # constructed, queried, and discarded without any context ever being
+        # stored, and the None check is cheaper than hashing into an empty dict.
+        self._store: Optional[Dict[Any, Dict[str, Any]]] = None
+        if initial_capacity > 0:
+            # Grow the dict's hash table once by filling it with placeholder
+            # keys, then delete them one by one: CPython never shrinks the
+            # table on deletion (clear() would reset it to minimum size), so
+            # the store keeps a table sized for ~'initial_capacity' entries
+            # and bulk inserts avoid the incremental resize storm.
+            self._store = dict.fromkeys(range(initial_capacity))
+            for placeholder in range(initial_capacity):
+                del self._store[placeholder]
+        # Intern table mapping structurally-equal tuple keys to one canonical
+        # instance. CPython caches a tuple's hash on the object, so reusing the
+        # canonical tuple skips recomputing the combined hash on repeat lookups.
+        # Keys are registered on write and dropped on delete, so the table is
+        # bounded by the number of live entries, not by every key ever seen.
+        self._intern: Dict[tuple, tuple] = {}
+
+    def _canonical(self, key: Any) -> Any:
+        """
+        Return the canonical interned instance for a tuple key, registering
+        it on first sight. Only called on writes; delete retires the entry,
+        keeping the intern table proportional to the stored keys. Non-tuple
+        keys pass through unchanged.
         """
-        self._store: Dict[Any, Dict[str, Any]] = {}
+        if isinstance(key, tuple):
+            return self._intern.setdefault(key, key)
+        return key
 
     def set(self, key: Any, value: Dict[str, Any]) -> None:
         """
@@ -29,26 +66,52 @@ class InMemoryContextStore:
 
         :param key: The hashable identifier to store context data for.
         :param value: The dictionary of metadata to store.
-        :raises ContextStoreError: (Rarely) if memory issues occur, or if usage is invalid.
+        :raises ContextStoreError: If 'key' is not hashable.
         """
-        # In practice, there's minimal risk of a "store error" in memory,
-        # but we keep the try-except structure for consistency.
+        if self._store is None:
+            self._store = {}
+        # A plain dict store cannot fail except for unhashable keys; catching
+        # only TypeError keeps the hot path free of a broad exception handler.
         try:
-            self._store[key] = value
-        except Exception as ex:
+            self._store[self._canonical(key)] = value
+        except TypeError as ex:
             raise ContextStoreError(f"Failed to set key {key}: {ex}")
 
+    def bulk_set(self, items: Iterable[Tuple[Any, Dict[str, Any]]]) -> None:
+        """
+        Store many (key, value) pairs in a single operation. Equivalent to
+        calling set() per pair, but merges everything with one dict.update so
+        the underlying table is resized at most once instead of per-insert.
+
+        :param items: An iterable (or mapping) of key/metadata pairs.
+        :raises ContextStoreError: If any key is unhashable or the merge fails.
+        """
+        if self._store is None:
+            self._store = {}
+        try:
+            pairs = items.items() if isinstance(items, dict) else items
+            self._store.update(
+                {self._canonical(key): value for key, value in pairs}
+            )
+        except Exception as ex:
+            raise ContextStoreError(f"Failed to bulk-set items: {ex}")
+
     def get(self, key: Any) -> Optional[Dict[str, Any]]:
         """
         Retrieve the metadata for 'key' if it exists.
 
         :param key: The identifier whose metadata we want.
         :return: The context metadata dictionary, or None if not found.
-        :raises ContextStoreError: If an unexpected error occurs.
+        :raises ContextStoreError: If 'key' is not hashable.
         """
+        if self._store is None:
+            return None
         try:
+            # No interning here: a read hashes the incoming key once either
+            # way, and registering never-stored keys would grow the intern
+            # table with the number of keys probed rather than stored.
             return self._store.get(key, None)
-        except Exception as ex:
+        except TypeError as ex:
             raise ContextStoreError(f"Failed to get key {key}: {ex}")
 
     def delete(self, key: Any) -> None:
@@ -56,12 +119,19 @@ class InMemoryContextStore:
         Remove the metadata associated with 'key'.
 
         :param key: The identifier referencing the stored metadata to remove.
-        :raises ContextStoreError: If a delete operation fails unexpectedly.
+        :raises ContextStoreError: If 'key' is not hashable.
         """
+        if self._store is None:
+            return
         try:
-            if key in self._store:
-                del self._store[key]
-        except Exception as ex:
+            # pop with a default hashes/probes the key once, versus twice for
+            # the old "if key in store: del store[key]" dance. The interned
+            # instance is retired with the entry to keep the table bounded;
+            # the intern pop is unconditional because non-tuple key objects
+            # (e.g. ColKey) compare equal to the tuple they must retire.
+            key = self._intern.pop(key, key)
+            self._store.pop(key, None)
+        except TypeError as ex:
             raise ContextStoreError(f"Failed to delete key {key}: {ex}")
 
     def list_keys(self) -> List[Any]:
@@ -69,9 +139,30 @@ class InMemoryContextStore:
         List all keys currently stored in this in-memory dictionary.
 
         :return: A list of keys that have associated metadata.
-        :raises ContextStoreError: If listing fails (unlikely in memory).
         """
-        try:
-            return list(self._store.keys())
-        except Exception as ex:
-            raise ContextStoreError(f"Failed to list keys: {ex}")
+        return [] if self._store is None else list(self._store)
+
+    def iter_keys(self) -> KeysView[Any]:
+        """
+        Return a live view of the stored keys without copying them into a
+        list. Preferable to list_keys for callers that only iterate; note the
+        view reflects (and must not outlive) subsequent mutations.
+
+        :return: A dictionary keys view over the stored keys.
+        """
+        if self._store is None:
+            # Materialize the lazy dict so the returned view stays live:
+            # a view over a throwaway dict would never see later writes.
+            self._store = {}
+        return self._store.keys()
+
+# Optional Cython-compiled store (see _in_memory_context_store.pyx for build
+# instructions). FastInMemoryContextStore resolves to the compiled class when
+# it has been built, and to the pure-Python class above otherwise, so callers
+# can request the fastest available backend unconditionally.
+try:
+    from ._in_memory_context_store import (
+        CInMemoryContextStore as FastInMemoryContextStore,
+    )
+except ImportError:
+    FastInMemoryContextStore = InMemoryContextStore
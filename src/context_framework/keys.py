@@ -0,0 +1,76 @@
+"""
+keys.py
+
+Defines lightweight key classes that stand in for the tuple key shapes used
+by adapters ("column", col_name) and ("row", row_index, "column", col_name).
+Each instance computes its hash once at construction and serves it from a
+slot afterwards, and compares equal to the corresponding plain tuple, so the
+two representations can be mixed freely as dict keys. Adapters can intern
+these objects (see PandasContextAdapter.canonical_key) so repeated use of a
+hot key reuses one instance instead of rebuilding and rehashing a tuple.
+
+Unlike tuples, these classes support weak references, which lets intern pools
+hold them via weakref.WeakValueDictionary and release entries for one-off
+keys as soon as callers drop them.
+"""
+
+from typing import Any, Tuple
+
+class ColKey:
+    """
+    A hash-caching stand-in for a ("column", col_name) key.
+    """
+
+    __slots__ = ("col", "_tuple", "_hash", "__weakref__")
+
+    def __init__(self, col: Any) -> None:
+        self.col = col
+        self._tuple = ("column", col)
+        self._hash = hash(self._tuple)
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """Return the equivalent plain tuple key."""
+        return self._tuple
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ColKey):
+            return other.col == self.col
+        if isinstance(other, tuple):
+            return other == self._tuple
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ColKey({self.col!r})"
+
+class RowColKey:
+    """
+    A hash-caching stand-in for a ("row", row_index, "column", col_name) key.
+    """
+
+    __slots__ = ("row", "col", "_tuple", "_hash", "__weakref__")
+
+    def __init__(self, row: Any, col: Any) -> None:
+        self.row = row
+        self.col = col
+        self._tuple = ("row", row, "column", col)
+        self._hash = hash(self._tuple)
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """Return the equivalent plain tuple key."""
+        return self._tuple
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RowColKey):
+            return other.row == self.row and other.col == self.col
+        if isinstance(other, tuple):
+            return other == self._tuple
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RowColKey({self.row!r}, {self.col!r})"
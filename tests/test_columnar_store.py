@@ -0,0 +1,45 @@
+import pytest
+from context_framework.columnar_context_store import ColumnarContextStore
+from context_framework.exceptions import ContextStoreError
+
+def test_columnar_store_basic_operations():
+    store = ColumnarContextStore()
+
+    store.set("key1", {"source": "fileA", "confidence": 0.9})
+    store.set("key2", {"source": "fileB"})
+
+    assert store.get("key1") == {"source": "fileA", "confidence": 0.9}
+    assert store.get("key2") == {"source": "fileB"}
+    assert store.get("nonexistent") is None
+
+    keys = store.list_keys()
+    assert "key1" in keys
+    assert "key2" in keys
+
+    store.delete("key1")
+    assert store.get("key1") is None
+    assert store.list_keys() == ["key2"]
+
+def test_columnar_store_overwrite_drops_stale_fields():
+    store = ColumnarContextStore()
+    store.set("key1", {"source": "fileA", "confidence": 0.9})
+    store.set("key1", {"source": "fileB"})
+    # The old 'confidence' field must not leak into the rewritten entry
+    assert store.get("key1") == {"source": "fileB"}
+
+def test_columnar_store_find_keys():
+    store = ColumnarContextStore()
+    store.set("key1", {"source": "fileA"})
+    store.set("key2", {"source": "fileB"})
+    store.set("key3", {"source": "fileA", "note": None})
+
+    assert sorted(store.find_keys("source", "fileA")) == ["key1", "key3"]
+    assert store.find_keys("source", "fileC") == []
+    assert store.find_keys("unknown_field", "x") == []
+    # None is a legitimate stored value, distinct from "field absent"
+    assert store.find_keys("note", None) == ["key3"]
+
+def test_columnar_store_unhashable_key():
+    store = ColumnarContextStore()
+    with pytest.raises(ContextStoreError):
+        store.set(["not", "hashable"], {"source": "fileA"})
@@ -29,3 +29,81 @@ def test_in_memory_store_exceptions():
         store.set("key", {"test": "data"})
     except ContextStoreError:
         pytest.fail("Setting a key should not raise ContextStoreError in normal usage.")
+
+def test_in_memory_store_bulk_set():
+    store = InMemoryContextStore(initial_capacity=16)
+
+    store.bulk_set({("column", "A"): {"info": "a"}, ("column", "B"): {"info": "b"}})
+    assert store.get(("column", "A")) == {"info": "a"}
+    assert store.get(("column", "B")) == {"info": "b"}
+
+    # Also accepts plain iterables of pairs
+    store.bulk_set([("key3", {"info": "c"})])
+    assert store.get("key3") == {"info": "c"}
+    assert len(store.list_keys()) == 3
+
+def test_in_memory_store_unhashable_key():
+    store = InMemoryContextStore()
+    with pytest.raises(ContextStoreError):
+        store.set(["not", "hashable"], {"info": "value"})
+    with pytest.raises(ContextStoreError):
+        store.get(["not", "hashable"])
+
+def test_in_memory_store_reads_before_first_write():
+    store = InMemoryContextStore()
+    # A never-written store answers reads without allocating its dict
+    assert store.get("anything") is None
+    assert store.list_keys() == []
+    store.delete("anything")  # no-op, no error
+    store.set("key", {"info": "value"})
+    assert store.get("key") == {"info": "value"}
+
+def test_in_memory_store_iter_keys():
+    store = InMemoryContextStore()
+    assert len(store.iter_keys()) == 0
+    store.set("key1", {"info": "value1"})
+    store.set("key2", {"info": "value2"})
+    # A live view, not a copy: it tracks later mutations
+    view = store.iter_keys()
+    assert set(view) == {"key1", "key2"}
+    store.delete("key2")
+    assert set(view) == {"key1"}
+
+def test_fast_store_alias_basic_operations():
+    # FastInMemoryContextStore is the compiled store when built, otherwise
+    # the pure-Python class; either way the contract is the same.
+    from context_framework.in_memory_context_store import FastInMemoryContextStore
+
+    store = FastInMemoryContextStore()
+    store.set("key1", {"info": "value1"})
+    assert store.get("key1") == {"info": "value1"}
+    assert store.get("missing") is None
+    assert "key1" in store.list_keys()
+    store.delete("key1")
+    assert store.get("key1") is None
+
+def test_in_memory_store_intern_table_tracks_live_keys():
+    store = InMemoryContextStore()
+    store.set(("column", "A"), {"info": "a"})
+    # Probing unseen keys must not grow the intern table
+    for i in range(50):
+        store.get(("column", f"probe{i}"))
+    assert len(store._intern) == 1
+    store.delete(("column", "A"))
+    assert len(store._intern) == 0
+
+def test_in_memory_store_iter_keys_live_before_first_write():
+    store = InMemoryContextStore()
+    view = store.iter_keys()
+    store.set("key1", {"info": "value1"})
+    assert set(view) == {"key1"}
+
+def test_in_memory_store_intern_retired_by_equal_key_object():
+    from context_framework.keys import ColKey
+
+    store = InMemoryContextStore()
+    store.set(("column", "A"), {"info": "a"})
+    # Deleting via an equal non-tuple key object retires the interned tuple
+    store.delete(ColKey("A"))
+    assert store.get(("column", "A")) is None
+    assert len(store._intern) == 0
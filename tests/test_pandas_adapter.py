@@ -29,13 +29,176 @@ def test_pandas_adapter_invalid_column():
 
 def test_pandas_adapter_row_context():
     df = pd.DataFrame({"GeneSymbol": ["BRCA1", "TP53"], "Expression": [12.3, 8.4]})
-    adapter = PandasContextAdapter(df)
+    adapter = PandasContextAdapter(df, validate_on_read=True)
 
     # Suppose we want to store context at row 0 for 'Expression'
     adapter.add_context(("row", 0, "column", "Expression"), {"note": "High expression"})
     result = adapter.get_context(("row", 0, "column", "Expression"))
     assert result == {"note": "High expression"}
 
-    # Check invalid row
+    # Check invalid row (reads only validate because validate_on_read=True)
     with pytest.raises(ContextKeyError):
         adapter.get_context(("row", 99, "column", "Expression"))
+
+def test_pandas_adapter_unvalidated_reads():
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+
+    # By default reads skip validation: an out-of-domain key returns None
+    assert adapter.get_context(("column", "Nonexistent")) is None
+    # The explicit fast path behaves the same even with validate_on_read=True
+    checked = PandasContextAdapter(df, validate_on_read=True)
+    assert checked.get_context_unchecked(("column", "Nonexistent")) is None
+
+def test_pandas_adapter_invalidate_caches():
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+
+    # Prime the cached lookups, then mutate the DataFrame schema. The
+    # frozenset cache is built explicitly: with the jit extra installed a
+    # validator hit never touches it, and an unprimed cache would be built
+    # (already fresh) after the mutation below.
+    adapter.add_context(("column", "ColA"), {"test": "data"})
+    adapter._cols()
+    df["ColB"] = [3, 4]
+
+    # Without invalidation the new column is not visible to validation
+    with pytest.raises(ContextKeyError):
+        adapter.add_context(("column", "ColB"), {"test": "data"})
+
+    adapter.invalidate_caches()
+    adapter.add_context(("column", "ColB"), {"test": "data"})
+    assert adapter.get_context(("column", "ColB")) == {"test": "data"}
+
+def test_pandas_adapter_cached_reads():
+    df = pd.DataFrame({"ColA": [1, 2]})
+    store = InMemoryContextStore()
+    adapter = PandasContextAdapter(df, context_store=store)
+
+    adapter.add_context(("column", "ColA"), {"source": "fileA"})
+    assert adapter.get_context(("column", "ColA"), cache=True) == {"source": "fileA"}
+
+    # A cached read is served by the adapter, not the store
+    store.delete(("column", "ColA"))
+    assert adapter.get_context(("column", "ColA"), cache=True) == {"source": "fileA"}
+    # Writing through the adapter evicts the cached entry
+    adapter.add_context(("column", "ColA"), {"source": "fileB"})
+    assert adapter.get_context(("column", "ColA"), cache=True) == {"source": "fileB"}
+    # Removal evicts as well
+    adapter.remove_context(("column", "ColA"))
+    assert adapter.get_context(("column", "ColA"), cache=True) is None
+
+def test_pandas_adapter_batch_context():
+    df = pd.DataFrame({"GeneSymbol": ["BRCA1", "TP53"], "Expression": [12.3, 8.4]})
+    adapter = PandasContextAdapter(df)
+
+    adapter.add_context_many({
+        ("column", "GeneSymbol"): {"source": "fileA"},
+        ("column", "Expression"): {"source": "fileB"},
+        ("row", 0, "column", "Expression"): {"note": "outlier"},
+    })
+    result = adapter.get_context_many([
+        ("column", "GeneSymbol"),
+        ("column", "Expression"),
+        ("column", "Missing"),
+    ])
+    assert result[("column", "GeneSymbol")] == {"source": "fileA"}
+    assert result[("column", "Expression")] == {"source": "fileB"}
+    assert result[("column", "Missing")] is None
+
+def test_pandas_adapter_batch_invalid_key_fails_whole_batch():
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+
+    with pytest.raises(ContextKeyError):
+        adapter.add_context_many({
+            ("column", "ColA"): {"ok": True},
+            ("column", "Nonexistent"): {"ok": False},
+        })
+    # Validation happens before any write
+    assert adapter.list_context_keys() == []
+
+def test_pandas_adapter_packed_keys():
+    df = pd.DataFrame({"GeneSymbol": ["BRCA1", "TP53"], "Expression": [12.3, 8.4]})
+    store = InMemoryContextStore()
+    adapter = PandasContextAdapter(df, context_store=store, pack_keys=True)
+
+    adapter.add_context(("column", "GeneSymbol"), {"source": "fileA"})
+    adapter.add_context(("row", 1, "column", "Expression"), {"note": "low"})
+    assert adapter.get_context(("column", "GeneSymbol")) == {"source": "fileA"}
+    assert adapter.get_context(("row", 1, "column", "Expression")) == {"note": "low"}
+
+    # Keys live in the store in their packed integer form
+    assert all(isinstance(k, int) for k in store.list_keys())
+
+    adapter.remove_context(("column", "GeneSymbol"))
+    assert adapter.get_context(("column", "GeneSymbol")) is None
+    assert adapter.get_context(("row", 1, "column", "Expression")) == {"note": "low"}
+
+def test_pandas_adapter_canonical_keys():
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+
+    key = adapter.canonical_key(("column", "ColA"))
+    # Structurally-equal tuples intern to the same instance
+    assert adapter.canonical_key(("column", "ColA")) is key
+
+    # Canonical keys and plain tuples are interchangeable
+    adapter.add_context(key, {"source": "fileA"})
+    assert adapter.get_context(("column", "ColA")) == {"source": "fileA"}
+    adapter.add_context(("column", "ColA"), {"source": "fileB"})
+    assert adapter.get_context(key) == {"source": "fileB"}
+    adapter.remove_context(key)
+    assert adapter.get_context(("column", "ColA")) is None
+
+    with pytest.raises(ContextKeyError):
+        adapter.add_context(adapter.canonical_key(("column", "Nope")), {})
+
+def test_pandas_adapter_key_pool_is_weak():
+    import gc
+
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+
+    key = adapter.canonical_key(("column", "ColA"))
+    assert adapter.canonical_key(("column", "ColA")) is key
+    del key
+    gc.collect()
+    # With no strong references left, the pooled instance is released
+    assert len(adapter._key_pool) == 0
+
+def test_pandas_adapter_invalidate_caches_resets_jit_tables():
+    pytest.importorskip("numba")
+    df = pd.DataFrame({"ColA": [1, 2], "ColB": [3, 4]})
+    adapter = PandasContextAdapter(df)
+
+    adapter.add_context(("column", "ColB"), {"test": "data"})
+    adapter.add_context(("row", 1), {"test": "data"})
+
+    # Shrink the schema: drop a column and a row label, then invalidate
+    del adapter.df["ColB"]
+    adapter.df.drop(index=1, inplace=True)
+    adapter.invalidate_caches()
+
+    with pytest.raises(ContextKeyError):
+        adapter.validate_key(("column", "ColB"))
+    with pytest.raises(ContextKeyError):
+        adapter.validate_key(("row", 1))
+    # Surviving labels still validate through the rebuilt tables
+    adapter.validate_key(("column", "ColA"))
+    adapter.validate_key(("row", 0))
+
+def test_pandas_adapter_cached_read_unhashable_key():
+    from context_framework.exceptions import ContextStoreError
+
+    df = pd.DataFrame({"ColA": [1, 2]})
+    adapter = PandasContextAdapter(df)
+    # A prior write allocates the lazy store; before that, reads short-circuit
+    # to None without ever hashing the key
+    adapter.add_context(("column", "ColA"), {"source": "fileA"})
+
+    # Cached and uncached reads fail identically on unhashable keys
+    with pytest.raises(ContextStoreError):
+        adapter.get_context(["not", "hashable"])
+    with pytest.raises(ContextStoreError):
+        adapter.get_context(["not", "hashable"], cache=True)